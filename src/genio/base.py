@@ -104,16 +104,21 @@ class Video:
         return buffer
 
 
+@cache
+def palette_rgb() -> np.ndarray:
+    """RGB triple for each palette index, as a `(n, 3)` uint8 array."""
+    palette = np.array(pyxel.colors.to_list(), dtype=np.uint32)
+    channels = [palette >> 16 & 0xFF, palette >> 8 & 0xFF, palette & 0xFF]
+    return np.stack(channels, axis=-1).astype(np.uint8)
+
+
+# Marks colours outside the palette; 254 is already taken by transparency.
+UNKNOWN_COLOR = 255
+
+
 @cache
 def calculate_rgb2paletteix() -> dict:
-    palette = pyxel.colors.to_list()
-    rgb2paletteix = {}
-    for i, rgb in enumerate(palette):
-        r = rgb >> 16 & 0xFF
-        g = rgb >> 8 & 0xFF
-        b = rgb & 0xFF
-        rgb2paletteix[(r, g, b)] = i
-    return rgb2paletteix
+    return {tuple(rgb): i for i, rgb in enumerate(palette_rgb().tolist())}
 
 
 def split_as_spritesheet(asset_args: tuple[str, ...]) -> tuple[list[str], str] | None:
@@ -178,38 +183,40 @@ def pil_image_from_spritesheet(asset_args: list[str], k: str) -> Image.Image:
 
 
 def load_as_buffer(*asset_args: str) -> np.ndarray:
-    rgb2paletteix = calculate_rgb2paletteix()
     if split := split_as_spritesheet(asset_args):
         spritesheet_args, k = split
         image = pil_image_from_spritesheet(spritesheet_args, k)
     else:
         image_path = asset_path(*asset_args)
         image = Image.open(image_path).convert("RGBA")
-    buffer = apply_palette_conversion(rgb2paletteix, image)
-    return buffer
-
+    return apply_palette_conversion(image)
 
-def apply_palette_conversion(rgb2paletteix, image: Image.Image) -> np.ndarray:
-    buffer = np.full((image.height, image.width), 254, dtype=np.uint8)
-
-    for y in range(image.height):
-        for x in range(image.width):
-            r, g, b, a = image.getpixel((x, y))
-            if a != 0:
-                if a != 255:
-                    ...
-                try:
-                    buffer[y, x] = rgb2paletteix[(r, g, b)]
-                except KeyError:
-                    rgb = (r, g, b)
-                    closest_color = min(
-                        rgb2paletteix.keys(),
-                        key=lambda c: sum((c[i] - rgb[i]) ** 2 for i in range(3)),
-                    )
-                    raise ValueError(
-                        f"Unexpected color: {r}, {g}, {b}; closest: {closest_color} at {rgb2paletteix[closest_color]}"
-                    )
 
+@cache
+def palette_lut() -> np.ndarray:
+    """Palette index for every packed `0xRRGGBB`, or `UNKNOWN_COLOR`."""
+    lut = np.full(1 << 24, UNKNOWN_COLOR, dtype=np.uint8)
+    for (r, g, b), i in calculate_rgb2paletteix().items():
+        lut[r << 16 | g << 8 | b] = i
+    return lut
+
+
+def apply_palette_conversion(image: Image.Image | np.ndarray) -> np.ndarray:
+    """Palette indices of an RGBA image, or of an `(h, w, 4)` uint8 array."""
+    pixels = np.asarray(image)
+    rgb = pixels[..., :3].astype(np.uint32)
+    buffer = palette_lut()[rgb[..., 0] << 16 | rgb[..., 1] << 8 | rgb[..., 2]]
+    opaque = pixels[..., 3] != 0
+    buffer[~opaque] = 254
+    if (unknown := opaque & (buffer == UNKNOWN_COLOR)).any():
+        y, x = np.argwhere(unknown)[0]
+        r, g, b = rgb[y, x].tolist()
+        palette = palette_rgb()
+        distances = ((palette.astype(np.int32) - (r, g, b)) ** 2).sum(axis=1)
+        closest_color = tuple(palette[distances.argmin()].tolist())
+        raise ValueError(
+            f"Unexpected color: {r}, {g}, {b}; closest: {closest_color} at {calculate_rgb2paletteix()[closest_color]}"
+        )
     return buffer
 
 
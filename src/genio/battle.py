@@ -7,7 +7,7 @@ from collections import Counter, deque
 from collections.abc import Iterator, Sequence
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from functools import cache, cached_property
+from functools import cache, cached_property, lru_cache
 from heapq import heappop, heappush
 from itertools import chain
 from random import randint
@@ -15,7 +15,7 @@ from typing import Annotated, Generic, Literal
 
 import numpy as np
 import tiktoken
-from parse import parse
+from parse import Parser, parse
 from smallperm import sample, shuffle
 from structlog import get_logger
 from typing_extensions import (
@@ -66,22 +66,37 @@ def parse_card_description(description: str) -> tuple[str, str, int]:
     return name, desc, copies
 
 
-from parse import search
+_card_art_parser = Parser("{}[{}]")
 
 
-def create_deck(cards: list[str]) -> list[Card]:
-    deck = []
+@lru_cache(16)
+def parse_deck_template(
+    cards: tuple[str, ...],
+) -> tuple[tuple[str, str | None, str | None], ...]:
+    """Parse deck descriptions into one (name, description, art name) per copy.
+
+    Deck definitions come from static predef data, so the parse is memoized;
+    `create_deck` still mints fresh `Card`s (and ids) on every call.
+    """
+    template = []
+    search_card_art = _card_art_parser.search
     for card_description in cards:
         name, desc, copies = parse_card_description(card_description)
         effective_name = None
         if "[" in name:
-            main_part, bracket_part = search("{}[{}]", name).fixed
+            main_part, bracket_part = search_card_art(name).fixed
             name = main_part
             effective_name = bracket_part
 
-        for _ in range(copies):
-            deck.append(Card(name=name, description=desc, card_art_name=effective_name))
-    return deck
+        template.extend([(name, desc, effective_name)] * copies)
+    return tuple(template)
+
+
+def create_deck(cards: Sequence[str]) -> list[Card]:
+    return [
+        Card(name=name, description=desc, card_art_name=effective_name)
+        for name, desc, effective_name in parse_deck_template(tuple(cards))
+    ]
 
 
 @dataclass
@@ -429,10 +444,11 @@ class CardBundle:
         if match := parse(expr, "#{:d}"):
             card_number = match.fixed[0]
             return self.deck[card_number]
+        needle = expr.lower()
         for card in chain(self.deck, self.hand, self.graveyard, self.resolving):
-            if card.name.lower() == expr.lower():
+            if card.name.lower() == needle:
                 return card
-            if card.short_id() == expr.lower():
+            if card.short_id() == needle:
                 return card
         raise ValueError(f"No card found with name '{expr}'")
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import random
 import re
-import uuid
 from base64 import b32encode
 from dataclasses import dataclass, field
 from functools import lru_cache
@@ -20,11 +20,24 @@ def judge_is_flashcard_like(card_description: str | None) -> bool:
     return re.search(keywords, card_description) is not None
 
 
+@lru_cache(1024)
+def short_id_of(card_id: str) -> str:
+    return b32encode(bytes.fromhex(card_id[:8])).decode().lower()[:4]
+
+
+_card_id_rng = random.Random()
+
+
+def new_card_id() -> str:
+    """A random 128-bit hex id; drawn in-process rather than from os.urandom."""
+    return f"{_card_id_rng.getrandbits(128):032x}"
+
+
 @dataclass
 class Card:
     name: str = ""
     description: str | None = None
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_card_id)
 
     card_art_name: str | None = None
 
@@ -41,7 +54,7 @@ class Card:
         return f"<{self.name}>"
 
     def short_id(self) -> str:
-        return b32encode(bytes.fromhex(self.id[:8])).decode().lower()[:4]
+        return short_id_of(self.id)
 
     @staticmethod
     def parse(s: str) -> Card:
@@ -483,10 +483,19 @@ class HasGold(Protocol):
     gold: int
 
 
-def draw_icon(x: int, y: int, icon_id: int) -> None:
+ICON_W, ICON_H = 16, 16
+
+
+@cache
+def icon_sheet() -> tuple[pyxel.Image, int]:
+    """The icon atlas and how many icons fit across one row of it."""
     icons = load_image("icons.png")
-    icon_w, icon_h = 16, 16
-    num_horz = icons.width // icon_w
+    return icons, icons.width // ICON_W
+
+
+def draw_icon(x: int, y: int, icon_id: int) -> None:
+    icons, num_horz = icon_sheet()
+    icon_w, icon_h = ICON_W, ICON_H
 
     icon_x = icon_id % num_horz
     icon_y = icon_id // num_horz
@@ -8,7 +8,7 @@ from abc import ABC
 from collections.abc import Callable
 from dataclasses import asdict, dataclass, fields, is_dataclass
 from datetime import time
-from functools import cache, partial, wraps
+from functools import cache, lru_cache, partial, wraps
 from pathlib import Path
 from textwrap import dedent
 from typing import (
@@ -27,7 +27,13 @@ from genio.base import asset_path
 from genio.eventbus import LLMInboundEv, LLMOutboundEv, event_bus
 from genio.utils.robustyaml import cleaning_parse
 from icecream import ic
-from jinja2 import BaseLoader, Environment, StrictUndefined, TemplateNotFound
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    StrictUndefined,
+    Template,
+    TemplateNotFound,
+)
 from langchain_core.exceptions import OutputParserException
 from langchain_core.output_parsers import BaseOutputParser
 from langchain_core.prompts import ChatPromptTemplate
@@ -94,7 +100,7 @@ class TemplateRegistryLoader(BaseLoader):
             target_path := (PROJECT_ROOT / Path("assets/includes") / template)
         ).exists():
             return target_path.read_text(), str(target_path), lambda: True
-        predef = slurp_toml(asset_path("strings.toml"))
+        predef = slurp_strings()
         if can_access(predef, template):
             return access(predef, template), template, lambda: True
         raise TemplateNotFound(template)
@@ -154,10 +160,16 @@ def jinja_global(func):
     return func
 
 
+@lru_cache(maxsize=256)
+def compile_template(template: str) -> Template:
+    """Compile a template string once; prompts are mostly static docstrings."""
+    return jinja_env.from_string(template)
+
+
 def render_text(
     template: str, context: dict[str, Any], consolidate: bool = True
 ) -> str:
-    template = jinja_env.from_string(template).render(context)
+    template = compile_template(template).render(context)
     if consolidate:
         return paragraph_consolidate(template)
     return template
@@ -458,6 +470,11 @@ def inst_for_struct(klass, ignore_set: set[str] | None = None) -> str:
     return prompt
 
 
+@cache
+def formatting_instructions_for(klass) -> str:
+    return inst_for_struct(klass)
+
+
 def make_str_of_value(value):
     if isinstance(value, str):
         return value
@@ -511,7 +528,7 @@ def promptly(f=None, demangle: bool = True):
             ctxt.append(yaml.dump(args))
             ctxt.append("```")
         input_str = "\n".join(ctxt)
-        formatting_instructions = inst_for_struct(return_type)
+        formatting_instructions = formatting_instructions_for(return_type)
         rest = (
             dict(
                 **{k: make_str_of_value(v) for k, v in args.items()},
@@ -622,6 +639,12 @@ def slurp_toml(path: str) -> dict:
         return tomlkit_to_popo(tomllib.load(f))
 
 
+@cache
+def slurp_strings() -> dict:
+    """Parse `strings.toml` once. Callers must not mutate the result."""
+    return slurp_toml(asset_path("strings.toml"))
+
+
 def yamlize(item: object) -> str:
     if is_dataclass(item):
         return yaml.dump(item.__dict__)
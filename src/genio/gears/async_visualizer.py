@@ -1,20 +1,24 @@
-import itertools
-import math
 from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from functools import cache
 from threading import Lock
 
+import numpy as np
 import pytweening
 import pyxel
 from atomicx import AtomicInt
-from pyxelxl import blt_rot
 
 from genio.base import WINDOW_HEIGHT, WINDOW_WIDTH, load_image
 from genio.components import CanAddAnim, dithering
-from genio.gears.paperlike import paper_cut_effect
+from genio.gears.paperlike import paper_cut_effect, rotate_image
 from genio.gears.stroke import StrokeAnim
-from genio.tween import Instant, Mutator, Tweener
+from genio.layout import lerp
+from genio.tween import Instant, Mutator, Tweener, Tweening
+
+ICON_ROTATION_STEP = 5
+# Below this, dithering leaves no pixels on screen.
+INVISIBLE_OPACITY = 1 / 32
 
 
 @cache
@@ -22,22 +26,41 @@ def icon_image() -> pyxel.Image:
     return paper_cut_effect(load_image("gemini_icon.png"), bg_color=254, fill_color=7)
 
 
+@cache
+def rotated_icons() -> tuple[pyxel.Image, ...]:
+    """The icon pre-rotated every `ICON_ROTATION_STEP` degrees."""
+    icon = icon_image()
+    return tuple(
+        rotate_image(icon, angle, colkey=254)
+        for angle in range(0, 360, ICON_ROTATION_STEP)
+    )
+
+
 class WavingText:
     def __init__(self, text: str) -> None:
         self.opacity = 0.0
         self.timer = 0
         self.text = text
+        self.phases = np.arange(len(text)) * 1.2
+        self.refresh_offsets()
+
+    def refresh_offsets(self) -> None:
+        self.y_offsets = np.sin(self.timer * 0.1 + self.phases).tolist()
 
     def y_offset_for_ix(self, i: int) -> float:
-        return math.sin(self.timer * 0.1 + i * 1.2) * 1
+        return self.y_offsets[i]
 
     def draw(self, x: int, y: int) -> None:
-        for i, char in enumerate(self.text):
-            with dithering(self.opacity):
-                pyxel.text(x + i * 4, y + self.y_offset_for_ix(i), char, 7)
+        if self.opacity <= INVISIBLE_OPACITY:
+            return
+        y_offsets = self.y_offsets
+        with dithering(self.opacity):
+            for i, char in enumerate(self.text):
+                pyxel.text(x + i * 4, y + y_offsets[i], char, 7)
 
     def update(self) -> None:
         self.timer += 1
+        self.refresh_offsets()
 
 
 @dataclass
@@ -61,27 +84,39 @@ class IndividualAnimation:
         self.dead = True
 
     def draw(self) -> None:
+        if self.opacity <= INVISIBLE_OPACITY:
+            return
+        icons = rotated_icons()
+        image = icons[round(self.rotation / ICON_ROTATION_STEP) % len(icons)]
         with dithering(self.opacity):
-            blt_rot(
-                self.x - 8,
-                self.y - 8,
-                icon_image(),
+            pyxel.blt(
+                self.x - image.width // 2,
+                self.y - image.height // 2,
+                image,
                 0,
                 0,
-                16,
-                16,
+                image.width,
+                image.height,
                 colkey=254,
-                rot=self.rotation,
             )
 
-    def on_start(self) -> None:
-        self.tweener.append_mutate(self, "opacity", 10, 1.0, "ease_in_quad")
-        for i in range(1000):
+    def spin(self) -> Iterator[None]:
+        i = 0
+        while not self.dead:
             wait_frame = 30 if i % 2 == 0 else 20
-            self.tweener2.append_mutate(
-                self, "rotation", wait_frame, 180 * (i + 1) + 0.1, "ease_in_out_quad"
+            yield from Mutator(
+                wait_frame,
+                pytweening.easeInOutQuad,
+                self,
+                "rotation",
+                180 * (i + 1) + 0.1,
             )
-            self.tweener2.append(range(wait_frame // 3))
+            yield from range(wait_frame // 3)
+            i += 1
+
+    def on_start(self) -> None:
+        self.tweener.append_mutate(self, "opacity", 10, 1.0, "ease_in_quad")
+        self.tweener2.append(self.spin())
 
     def on_end(self) -> None:
         self.tweener.append_mutate(self, "opacity", 10, 0.0, "ease_out_quad")
@@ -96,33 +131,35 @@ class AsyncVisualizer:
         self.tweener = Tweener(variable_play_speed=True)
         self.tweener2 = Tweener(variable_play_speed=False)
         self.animations = deque()
+        # Immutable copy of `animations`, republished under the lock by
+        # ping/pong so that update/draw can iterate it without locking.
+        self.animation_snapshot: tuple[IndividualAnimation, ...] = ()
         self.target_number = AtomicInt(0)
         self.phasing_out_animations = []
         self.text = text
+        self.text_x = WINDOW_WIDTH - len(text) * 4 - 10
+        self.text_y = WINDOW_HEIGHT - 15
         self.waver = WavingText(self.text)
         self.strokes = []
         self.scene = scene
         self.lock = Lock()
-        icon_image()
+        rotated_icons()
 
     def ping(self) -> None:
         next_count = self.target_number.load() + 1
         x, y = self.calculate_position(len(self.animations), next_count)
         with self.lock:
             self.animations.appendleft(anim := IndividualAnimation(x, y))
+            self.animation_snapshot = tuple(self.animations)
         anim.on_start()
         old_number = self.target_number.inc()
         if old_number == 0:
             self.tweener2.append_mutate(self.waver, "opacity", 10, 1.0, "ease_in_quad")
-            stroke_x, stroke_y = (
-                WINDOW_WIDTH - len(self.text) * 4 - 10,
-                WINDOW_HEIGHT - 15,
-            )
             stroke_width = len(self.text) * 4
             self.strokes.append(
                 StrokeAnim(
-                    stroke_x,
-                    stroke_y,
+                    self.text_x,
+                    self.text_y,
                     stroke_width,
                     self.scene,
                 )
@@ -130,27 +167,35 @@ class AsyncVisualizer:
         self.refresh_animation_positions()
 
     def draw(self) -> None:
-        with self.lock:
-            for anim in self.animations:
-                anim.draw()
+        for anim in self.animation_snapshot:
+            anim.draw()
         for anim in self.phasing_out_animations:
             anim.draw()
-        self.waver.draw(WINDOW_WIDTH - len(self.text) * 4 - 10, WINDOW_HEIGHT - 15)
+        self.waver.draw(self.text_x, self.text_y)
 
     def refresh_animation_positions(self):
-        tweens = []
-        for i, anim in enumerate(self.animations):
-            x, y = self.calculate_position(i, len(self.animations))
-            tweens.append(Mutator(10, pytweening.easeInOutQuad, anim, "x", x))
-            tweens.append(Mutator(10, pytweening.easeInOutQuad, anim, "y", y))
-        simutaneous_tween = itertools.zip_longest(*tweens)
-        self.tweener.append(simutaneous_tween)
+        animations = self.animation_snapshot
+        targets = [
+            (anim, self.calculate_position(i, len(animations)))
+            for i, anim in enumerate(animations)
+        ]
+        self.tweener.append(self.move_to_targets(targets))
+
+    @staticmethod
+    def move_to_targets(
+        targets: list[tuple[IndividualAnimation, tuple[int, int]]],
+    ) -> Iterator[None]:
+        for t in Tweening(10, pytweening.easeInOutQuad):
+            for anim, target in targets:
+                anim.x, anim.y = lerp((anim.x, anim.y), target, t)
+            yield
 
     def pong(self) -> None:
         if self.target_number.load() == 0:
             return
         with self.lock:
             first_anim = self.animations.popleft()
+            self.animation_snapshot = tuple(self.animations)
         first_anim.on_end()
         self.phasing_out_animations.append(first_anim)
         old_number = self.target_number.dec()
@@ -159,14 +204,14 @@ class AsyncVisualizer:
         self.refresh_animation_positions()
 
     def update(self) -> None:
-        with self.lock:
-            for anim in self.animations:
-                anim.update()
+        for anim in self.animation_snapshot:
+            anim.update()
         for anim in self.phasing_out_animations:
             anim.update()
-        self.phasing_out_animations = [
-            anim for anim in self.phasing_out_animations if not anim.dead
-        ]
+        if any(anim.dead for anim in self.phasing_out_animations):
+            self.phasing_out_animations = [
+                anim for anim in self.phasing_out_animations if not anim.dead
+            ]
         self.waver.update()
         self.tweener.update()
         self.tweener2.update()
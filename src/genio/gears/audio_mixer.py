@@ -1,10 +1,37 @@
-import librosa
+from functools import cache
+
 import numpy as np
 import soundfile as sf
 
 SAMPLE_RATE = 44100
 
 
+@cache
+def mix_kernel():
+    """Compile the mixing loop on first use, so importing this module stays light."""
+    import numba
+
+    @numba.jit(nopython=True)
+    def kernel(
+        mixed: np.ndarray,
+        num_mixed: np.ndarray,
+        sample_buffer: np.ndarray,
+        sample_offsets: np.ndarray,
+        frame_ids: np.ndarray,
+        sample_ids: np.ndarray,
+        fps: int,
+    ) -> None:
+        for k in range(frame_ids.size):
+            start = int(frame_ids[k] / fps * SAMPLE_RATE)
+            s0 = sample_offsets[sample_ids[k]]
+            s1 = sample_offsets[sample_ids[k] + 1]
+            for j in range(s1 - s0):
+                mixed[start + j] += sample_buffer[s0 + j]
+                num_mixed[start + j] += 1
+
+    return kernel
+
+
 def mix_audio(
     samples: list[np.ndarray],
     events: list[list[int]],
@@ -19,20 +46,29 @@ def mix_audio(
         total_num_seconds * SAMPLE_RATE + max(len(s) for s in samples)
     )
     mixed = np.zeros(total_num_samples, dtype=np.float32)
-    num_mixed = np.zeros(total_num_samples, dtype=np.uint8)
-    for current_frame, events in enumerate(events):
-        for event in events:
-            sample = samples[event]
-            start = int(current_frame / fps * SAMPLE_RATE)
-            end = start + len(sample)
-            mixed[start:end] += sample
-            num_mixed[start:end] += 1
-    mixed /= np.maximum(num_mixed, 1)
+    num_mixed = np.zeros(total_num_samples, dtype=np.uint16)
+    sample_buffer = np.concatenate(samples).astype(np.float32, copy=False)
+    sample_offsets = np.zeros(len(samples) + 1, dtype=np.int64)
+    np.cumsum([len(s) for s in samples], out=sample_offsets[1:])
+    frame_ids = np.array(
+        [frame for frame, evs in enumerate(events) for _ in evs], dtype=np.int64
+    )
+    sample_ids = np.array([event for evs in events for event in evs], dtype=np.int64)
+    mix_kernel()(
+        mixed, num_mixed, sample_buffer, sample_offsets, frame_ids, sample_ids, fps
+    )
+    np.divide(mixed, num_mixed, out=mixed, where=num_mixed > 0)
     return mixed
 
 
 def load_audio_sample(filepath: str) -> np.ndarray:
-    data, samplerate = librosa.load(filepath, sr=SAMPLE_RATE)
+    data, samplerate = sf.read(filepath, dtype="float32")
+    if data.ndim > 1:
+        data = data.mean(axis=1, dtype=np.float32)
+    if samplerate != SAMPLE_RATE:
+        import librosa
+
+        data = librosa.resample(data, orig_sr=samplerate, target_sr=SAMPLE_RATE)
     return data
 
 
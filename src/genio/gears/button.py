@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TypeAlias
+from typing import NamedTuple
 
-import numpy as np
 import pyxel
 from pyxelxl import layout
 
@@ -28,20 +27,19 @@ COLOR_SCHEME_PRIMARY = ColorScheme(3, 11)
 COLOR_SCHEME_SECONDARY = ColorScheme(4, 8)
 
 
-Vec2: TypeAlias = np.ndarray
+class Vec2(NamedTuple):
+    x: int
+    y: int
 
 
 def vec2(x: int, y: int) -> Vec2:
-    return np.array([x, y], dtype=int)
+    return Vec2(x, y)
 
 
 def is_mouse_in_rect(xy: Vec2, wh: Vec2) -> bool:
-    return (
-        xy[0] <= pyxel.mouse_x
-        and pyxel.mouse_x < xy[0] + wh[0]
-        and xy[1] <= pyxel.mouse_y
-        and pyxel.mouse_y < xy[1] + wh[1]
-    )
+    x, y = xy
+    w, h = wh
+    return x <= pyxel.mouse_x < x + w and y <= pyxel.mouse_y < y + h
 
 
 @dataclass
@@ -62,14 +60,14 @@ class ButtonElement:
         button_width = 55
         c1, c2 = self.color_scheme.primary, self.color_scheme.secondary
         if self.hovering:
-            draw_rounded_rectangle(*(xy + vec2(0, 1)), button_width, 16, 4, c1)
+            draw_rounded_rectangle(xy.x, xy.y + 1, button_width, 16, 4, c1)
             draw_rounded_rectangle(*xy, button_width, 16, 4, c1)
             if not pyxel.btn(pyxel.MOUSE_BUTTON_LEFT):
                 with dithering(0.5):
                     draw_rounded_rectangle(*xy, button_width, 16, 4, c2)
             self.draw_text_centered(xy, button_width)
         else:
-            draw_rounded_rectangle(*(xy + vec2(0, 1)), button_width, 16, 4, c1)
+            draw_rounded_rectangle(xy.x, xy.y + 1, button_width, 16, 4, c1)
             draw_rounded_rectangle(*xy, button_width, 16, 4, c2)
             self.draw_text_centered(xy, button_width)
         return vec2(button_width + 2, 16)
@@ -35,14 +35,11 @@ def paste_center(
 ) -> None:
     x = (target.shape[1] - src.shape[1]) // 2
     y = (target.shape[0] - src.shape[0]) // 2
+    dst = target[y + offset : y + src.shape[0] + offset, x : x + src.shape[1]]
     if ignore is not None:
-        target[y + offset : y + src.shape[0] + offset, x : x + src.shape[1]] = np.where(
-            src == ignore,
-            target[y + offset : y + src.shape[0] + offset, x : x + src.shape[1]],
-            src,
-        )
+        np.copyto(dst, src, where=src != ignore)
     else:
-        target[y + offset : y + src.shape[0] + offset, x : x + src.shape[1]] = src[:]
+        dst[:] = src
 
 
 @functools.cache
@@ -53,12 +50,28 @@ def empty_card() -> pyxel.Image:
     return image
 
 
-def printable_tokens(word: str) -> list[str] | None:
+STATIC_CARD_ART = {
+    "3 of Spades": "three-of-spades.png",
+    "6 of Hearts": "six-of-hearts.png",
+    "4 of Diamonds": "four-of-diamonds.png",
+    "4 of Spades": "four-of-spades.png",
+    "The Fool": "the-fool.png",
+    "The Emperor": "the-emperor.png",
+    "Block": "block.png",
+    "Slash": "slash.png",
+    "left": "left.png",
+    "right": "right.png",
+    "Smash": "smash.png",
+}
+
+
+@functools.cache
+def printable_tokens(word: str) -> tuple[str, ...] | None:
     if len(word) <= 9:
-        return [word]
+        return (word,)
     if " " not in word:
         return None
-    tokens = word.split()
+    tokens = tuple(word.split())
     if len(tokens) > 2:
         return None
     if all(printable_tokens(token) for token in tokens):
@@ -71,41 +84,21 @@ class CardPrinter:
             [asset_path("preprocess.json"), asset_path("card_art.json")],
             build_search_index=True,
         )
+        # Printed images are shared between callers, who only ever blit them.
+        self._cache: dict[tuple[str, str | None, str | None], pyxel.Image] = {}
+        self._glyph_scratch = pyxel.Image(CARD_WIDTH, CARD_HEIGHT)
 
     def print_card(self, card: Card) -> pyxel.Image:
+        key = (card.name, card.card_art_name, card.description)
+        if (image := self._cache.get(key)) is None:
+            image = self._cache[key] = self._print_card_uncached(card)
+        return image
+
+    def _print_card_uncached(self, card: Card) -> pyxel.Image:
         card_name = card.card_art_name or card.name
-        match card_name:
-            case "3 of Spades":
-                return load_image("cards", "three-of-spades.png")
-            case "6 of Hearts":
-                return load_image("cards", "six-of-hearts.png")
-            case "4 of Diamonds":
-                return load_image("cards", "four-of-diamonds.png")
-            case "4 of Spades":
-                return load_image("cards", "four-of-spades.png")
-            case "The Fool":
-                image = copy_image(load_image("cards", "the-fool.png"))
-                return image
-            case "The Emperor":
-                image = copy_image(load_image("cards", "the-emperor.png"))
-                return image
-            case "Block":
-                image = copy_image(load_image("cards", "block.png"))
-                return image
-            case "Slash":
-                image = copy_image(load_image("cards", "slash.png"))
-                return image
-            case "left":
-                image = copy_image(load_image("cards", "left.png"))
-                return image
-            case "right":
-                image = copy_image(load_image("cards", "right.png"))
-                return image
-            case "Smash":
-                image = copy_image(load_image("cards", "smash.png"))
-                return image
-            case _:
-                return self._print_card(card)
+        if (art := STATIC_CARD_ART.get(card_name)) is not None:
+            return load_image("cards", art)
+        return self._print_card(card)
 
     def _print_card(self, card: Card) -> pyxel.Image:
         if card.is_flashcard_like():
@@ -176,12 +169,10 @@ class CardPrinter:
         rasterized = np.pad(rasterized, ((0, pad_width), (0, 0)), constant_values=7)
         rasterized = np.rot90(rasterized)
         rasterized = np.pad(rasterized, ((pad_width, 0), (0, 0)), constant_values=7)
-        # blt manually
-        for y, row in enumerate(rasterized):
-            for x, col in enumerate(row):
-                if col != 0:
-                    continue
-                image.pset(x, y, col)
+        target = _image_as_ndarray(image)
+        h = min(rasterized.shape[0], target.shape[0])
+        w = min(rasterized.shape[1], target.shape[1])
+        target[:h, :w][rasterized[:h, :w] == 0] = 0
 
     def apply_serif_text(
         self,
@@ -197,28 +188,28 @@ class CardPrinter:
             ch = ch.upper()
         elif compression >= 1:
             ch = ch.lower()
-        copied = pyxel.Image(CARD_WIDTH, CARD_HEIGHT)
+        copied = self._glyph_scratch
         copied_data = _image_as_ndarray(copied)
-        copied_data[:] = 254
-        for dx, dy in [(-1, 0), (1, 0), (0, 1), (0, -1)]:
-            card_text(
-                bx + dx,
-                y_offset + dy,
-                ch,
-                0,
-                layout=layout(w=11, ha="center"),
-                target=copied,
-            )
+        copied_data.fill(254)
         card_text(
             bx,
             y_offset,
             ch,
-            7,
+            0,
             layout=layout(w=11, ha="center"),
             target=copied,
         )
+        # Outline the glyph by dilating it one pixel in each cardinal direction.
+        glyph = copied_data == 0
+        outline = np.zeros_like(glyph)
+        outline[:-1] |= glyph[1:]
+        outline[1:] |= glyph[:-1]
+        outline[:, :-1] |= glyph[:, 1:]
+        outline[:, 1:] |= glyph[:, :-1]
+        copied_data[outline] = 0
+        copied_data[glyph] = 7
         if rot180:
-            copied_data[:] = np.rot90(copied_data, 2)
+            copied_data[:] = copied_data[::-1, ::-1]
         paste_center(
             _image_as_ndarray(copied),
             _image_as_ndarray(image),
@@ -47,12 +47,15 @@ class RadioGroup:
         self.last_chosen = chosen
         self.tweener = Tweener()
         self.hovering_timer = 0
+        endpoints = np.linspace(x, x + width, len(choices) + 1)
+        self.segments = [
+            (int(start), int(end)) for start, end in zip(endpoints[:-1], endpoints[1:])
+        ]
+        self.segment_width = width // len(choices)
 
     def update(self) -> None:
-        endpoints = np.linspace(self.x, self.x + self.width, len(self.choices) + 1)
         any_hovering = False
-        for i, (start, end) in enumerate(zip(endpoints[:-1], endpoints[1:])):
-            start, end = int(start), int(end)
+        for i, (start, end) in enumerate(self.segments):
             if (
                 pyxel.mouse_x >= start
                 and pyxel.mouse_x <= end
@@ -80,19 +83,13 @@ class RadioGroup:
 
     def draw(self) -> None:
         draw_rounded_rectangle(self.x, self.y, self.width, 11, 5, self.c1)
-        endpoints = np.linspace(self.x, self.x + self.width, len(self.choices) + 1)
-        start = self.x + self.apparent_chosen * (self.width // len(self.choices))
-        draw_rounded_rectangle(
-            start, self.y, self.width // len(self.choices), 11, 5, 14
-        )
+        start = self.x + self.apparent_chosen * self.segment_width
+        draw_rounded_rectangle(start, self.y, self.segment_width, 11, 5, 14)
         if self.hovering is not None:
             with dithering(0.5 * sin_01(self.hovering_timer, 0.15)):
-                start = self.x + self.hovering * (self.width // len(self.choices))
-                draw_rounded_rectangle(
-                    start, self.y, self.width // len(self.choices), 11, 5, 14
-                )
-        for i, (start, end) in enumerate(zip(endpoints[:-1], endpoints[1:])):
-            start, end = int(start), int(end)
+                start = self.x + self.hovering * self.segment_width
+                draw_rounded_rectangle(start, self.y, self.segment_width, 11, 5, 14)
+        for i, (start, end) in enumerate(self.segments):
             w = end - start
             if self.apparent_chosen and i == round(self.apparent_chosen):
                 capital_hill_text(
@@ -1,60 +1,101 @@
 import argparse
 import json
+import mmap
 import os
+from collections import deque
 from collections.abc import Iterator
-from functools import cache
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
 from pathlib import Path
 
 import cramjam
 import numpy as np
-import PIL.Image as Image
 import pyxel
 import soundfile as sf
-import torch
-import torchvision.transforms as T
 import webp
 from safetensors.numpy import load
 
-from genio.base import asset_path
+from genio.base import asset_path, palette_rgb
 from genio.gears.audio_mixer import load_audio_sample, mix_audio
 from genio.predef import access_predef
 
 
-def iterator_of_raw_frames(parent: str) -> Iterator[tuple[np.ndarray, list[int]]]:
-    dirs = sorted(glob(f"{parent}/*-*"))
-    for chunk in dirs:
-        if not os.path.exists(f"{chunk}/frames.safetensors.zstd"):
-            continue
-        with open(f"{chunk}/frames.safetensors.zstd", "rb") as f:
-            buffer = load(bytes(cramjam.zstd.decompress(f.read())))
-            frames = buffer["frames"]
-        with open(f"{chunk}/events.json") as f:
-            events = json.load(f)
-        yield frames, events
+def decompress_file(path: str) -> cramjam.Buffer:
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as compressed:
+            return cramjam.zstd.decompress(compressed)
 
 
-@cache
-def calculate_rgb2paletteix() -> dict:
-    palette = pyxel.colors.to_list()
-    rgb2paletteix = {}
-    for i, rgb in enumerate(palette):
-        r = rgb >> 16 & 0xFF
-        g = rgb >> 8 & 0xFF
-        b = rgb & 0xFF
-        rgb2paletteix[(r, g, b)] = i
-    return rgb2paletteix
+def has_raw_frames(chunk: str) -> bool:
+    return os.path.exists(f"{chunk}/frames.zstd") or os.path.exists(
+        f"{chunk}/frames.safetensors.zstd"
+    )
+
+
+def load_raw_chunk(chunk: str) -> tuple[np.ndarray, list[int]]:
+    if os.path.exists(f"{chunk}/frames.zstd"):
+        with open(f"{chunk}/frames.json") as f:
+            header = json.load(f)
+        frames = np.frombuffer(
+            decompress_file(f"{chunk}/frames.zstd"), dtype=header["dtype"]
+        ).reshape(header["shape"])
+    else:
+        # Recordings made before frames were stored as raw bytes.
+        buffer = load(bytes(decompress_file(f"{chunk}/frames.safetensors.zstd")))
+        frames = buffer["frames"]
+    with open(f"{chunk}/events.json") as f:
+        events = json.load(f)
+    return frames, events
+
+
+def iterator_of_raw_frames(
+    parent: str, prefetch: int = 2
+) -> Iterator[tuple[np.ndarray, list[int]]]:
+    """Yield chunks in order while the next `prefetch` load in the background."""
+    chunks = [chunk for chunk in sorted(glob(f"{parent}/*-*")) if has_raw_frames(chunk)]
+    with ThreadPoolExecutor(prefetch) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(load_raw_chunk, chunk))
+            if len(pending) > prefetch:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 
 def frame_to_rgb_tensor(frame: np.ndarray) -> np.ndarray:
-    rgb2paletteix = calculate_rgb2paletteix()
-    paletteix2rgb = {v: k for k, v in rgb2paletteix.items()}
-    rgb2paletteix_arr = np.array([paletteix2rgb[i] for i in range(16)], dtype=np.uint8)
-    return rgb2paletteix_arr[frame]
+    return palette_rgb()[frame]
+
+
+class AnimatedWebPWriter:
+    """Lossless animated WebP encoder fed one RGB chunk at a time."""
+
+    def __init__(self, fps: int = 30) -> None:
+        self.fps = fps
+        # Preset 1 encodes about 2x faster than the default for ~3% larger files.
+        self.config = webp.WebPConfig.new(lossless=True, lossless_preset=1)
+        self.encoder = None
+        self.num_frames = 0
+
+    def timestamp(self) -> int:
+        return round(self.num_frames * 1000 / self.fps)
 
+    def add_frames(self, frames: np.ndarray) -> None:
+        for frame in frames:
+            if self.encoder is None:
+                self.encoder = webp.WebPAnimEncoder.new(
+                    frame.shape[1], frame.shape[0], webp.WebPAnimEncoderOptions.new()
+                )
+            picture = webp.WebPPicture.from_numpy(frame)
+            self.encoder.encode_frame(picture, self.timestamp(), self.config)
+            self.num_frames += 1
 
-def resize2x(img: torch.Tensor) -> torch.Tensor:
-    return T.Resize((240 * 4, 427 * 4))(img)
+    def save(self, path: str) -> None:
+        if self.encoder is None:
+            raise ValueError("No frames to save")
+        anim_data = self.encoder.assemble(self.timestamp())
+        with open(path, "wb") as f:
+            f.write(anim_data.buffer())
 
 
 def detect_need_conversion_inputs() -> Iterator[str]:
@@ -75,16 +116,13 @@ if __name__ == "__main__":
     audio_samples = [load_audio_sample(asset_path(p)) for p in sound_effect_paths]
     pyxel.init(128, 128)
     for c in candidates:
-        pil_images = []
+        writer = AnimatedWebPWriter(fps=30)
         events = []
-        for i, (frame, evs) in enumerate(iterator_of_raw_frames(c)):
-            rgb_tensor = frame_to_rgb_tensor(frame)
-            conv = rgb_tensor
+        for frames, evs in iterator_of_raw_frames(c):
+            writer.add_frames(frame_to_rgb_tensor(frames))
             events.extend(evs)
-            for i in conv:
-                pil_images.append(Image.fromarray(i))
         output_p = Path(c) / "export.webp"
         output_audio_p = Path(c) / "export.wav"
-        webp.save_images(pil_images, str(output_p), lossless=True, fps=30)
+        writer.save(str(output_p))
         mixed = mix_audio(audio_samples, events)
         sf.write(output_audio_p, mixed, 44100)
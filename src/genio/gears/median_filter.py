@@ -7,38 +7,21 @@ import pytweening
 import pyxel
 from pyxelxl import blt_rot
 
-from genio.base import load_image
+from genio.base import load_image, palette_rgb
 from genio.components import dithering
 from genio.scene import Scene
 from genio.tween import Mutator, Tweener
 
 
 @cache
-def calculate_rgb2paletteix() -> dict:
-    palette = pyxel.colors.to_list()
-    rgb2paletteix = {}
-    for i, rgb in enumerate(palette):
-        r = rgb >> 16 & 0xFF
-        g = rgb >> 8 & 0xFF
-        b = rgb & 0xFF
-        rgb2paletteix[(r, g, b)] = i
-    return rgb2paletteix
-
-
-@cache
-def calculate_paletteix2rgb() -> dict:
-    return {v: k for k, v in calculate_rgb2paletteix().items()}
+def palette_brightness() -> tuple[float, ...]:
+    return tuple(rgb_u8_to_brightness_f32(rgb) for rgb in palette_rgb().tolist())
 
 
 def median_color(arr: list[int]) -> int:
     if not arr:
         raise ValueError("Empty array")
-    forward = calculate_paletteix2rgb()
-
-    def ix2brightness(ix: int) -> float:
-        return rgb_u8_to_brightness_f32(forward[ix])
-
-    arr.sort(key=ix2brightness)
+    arr.sort(key=palette_brightness().__getitem__)
     return arr[len(arr) // 2]
 
 
@@ -1,18 +1,18 @@
 from functools import cache
 
-import numba
 import numpy as np
 import pyxel
 from pyxelxl.font import _image_as_ndarray
 from pyxelxl.pyxelxl import rotate
 
 from genio.base import load_image
+from genio.components import ICON_H, ICON_W, icon_sheet
 from genio.ps import uv_for_16
 
 
-def rotate_image(image: pyxel.Image, angle: int) -> pyxel.Image:
+def rotate_image(image: pyxel.Image, angle: int, colkey: int = 0) -> pyxel.Image:
     buffer = _image_as_ndarray(image)
-    new_buffer = rotate(buffer, 0, angle)
+    new_buffer = rotate(buffer, colkey, angle)
     new_image = pyxel.Image(new_buffer.shape[1], new_buffer.shape[0])
     _image_as_ndarray(new_image)[:] = new_buffer
     return new_image
@@ -20,15 +20,7 @@ def rotate_image(image: pyxel.Image, angle: int) -> pyxel.Image:
 
 def zoom_2x(image: pyxel.Image) -> pyxel.Image:
     buffer = _image_as_ndarray(image)
-    new_buffer = np.zeros(
-        (buffer.shape[0] * 2, buffer.shape[1] * 2), dtype=buffer.dtype
-    )
-    for i in range(buffer.shape[0]):
-        for j in range(buffer.shape[1]):
-            new_buffer[i * 2, j * 2] = buffer[i, j]
-            new_buffer[i * 2 + 1, j * 2] = buffer[i, j]
-            new_buffer[i * 2, j * 2 + 1] = buffer[i, j]
-            new_buffer[i * 2 + 1, j * 2 + 1] = buffer[i, j]
+    new_buffer = buffer.repeat(2, axis=0).repeat(2, axis=1)
     new_image = pyxel.Image(new_buffer.shape[1], new_buffer.shape[0])
     _image_as_ndarray(new_image)[:] = new_buffer
     return new_image
@@ -37,14 +29,18 @@ def zoom_2x(image: pyxel.Image) -> pyxel.Image:
 GRANULARITY = 20
 
 
+@cache
+def prerotated_images(spr: int) -> tuple[pyxel.Image, ...]:
+    """Rotations of sprite `spr` from image bank 1, shared by every instance."""
+    source_image = pyxel.Image(8, 8)
+    source_image.blt(0, 0, 1, *uv_for_16(spr), 8, 8)
+    source_image = zoom_2x(source_image)
+    return tuple(rotate_image(source_image, i) for i in range(0, 360, GRANULARITY))
+
+
 class PrerotatedImage:
     def __init__(self, spr: int) -> None:
-        self.images = []
-        source_image = pyxel.Image(8, 8)
-        source_image.blt(0, 0, 1, *uv_for_16(spr), 8, 8)
-        source_image = zoom_2x(source_image)
-        for i in range(0, 360, GRANULARITY):
-            self.images.append(rotate_image(source_image, i))
+        self.images = prerotated_images(spr)
 
     def image_for_angle(self, angle: int) -> pyxel.Image:
         angle = int(angle)
@@ -69,9 +65,8 @@ class PrerotatedImage:
 
 
 def draw_icon(x: int, y: int, icon_id: int) -> None:
-    icons = load_image("icons.png")
-    icon_w, icon_h = 16, 16
-    num_horz = icons.width // icon_w
+    icons, num_horz = icon_sheet()
+    icon_w, icon_h = ICON_W, ICON_H
 
     icon_x = icon_id % num_horz
     icon_y = icon_id // num_horz
@@ -89,52 +84,49 @@ def draw_rounded_rectangle(x: int, y: int, w: int, h: int, r: int, col: int) ->
     pyxel.circ(x + w - r, y + h - r, r, col)
 
 
-@numba.jit(nopython=True)
 def remove_isolated_pixels(image: np.ndarray, bg_color: int) -> np.ndarray:
+    """Clear interior foreground pixels that have no foreground 8-neighbour."""
     h, w = image.shape
+    foreground = image != bg_color
+    has_neighbour = np.zeros_like(foreground[1:-1, 1:-1])
+    for di in range(-1, 2):
+        for dj in range(-1, 2):
+            if di != 0 or dj != 0:
+                has_neighbour |= foreground[1 + di : h - 1 + di, 1 + dj : w - 1 + dj]
     output = image.copy()
-    for i in range(1, h - 1):
-        for j in range(1, w - 1):
-            if image[i, j] != bg_color:
-                # Check 8-neighbors
-                is_isolated = True
-                for di in range(-1, 2):
-                    for dj in range(-1, 2):
-                        if (di != 0 or dj != 0) and image[i + di, j + dj] != bg_color:
-                            is_isolated = False
-                            break
-                    if not is_isolated:
-                        break
-                if is_isolated:
-                    output[i, j] = bg_color
+    output[1:-1, 1:-1][foreground[1:-1, 1:-1] & ~has_neighbour] = bg_color
+    return output
+
+
+@cache
+def disk_offsets(radius: int) -> tuple[tuple[int, int], ...]:
+    """Offsets within `radius` of the origin, capped to a 7x7 neighbourhood."""
+    return tuple(
+        (di, dj)
+        for di in range(-3, 4)
+        for dj in range(-3, 4)
+        if di * di + dj * dj <= radius * radius
+    )
+
+
+def dilate(mask: np.ndarray, radius: int) -> np.ndarray:
+    h, w = mask.shape
+    padded = np.pad(mask, 3)
+    output = np.zeros_like(mask)
+    for di, dj in disk_offsets(radius):
+        output |= padded[3 + di : 3 + di + h, 3 + dj : 3 + dj + w]
     return output
 
 
-@numba.jit(nopython=True)
 def apply_paper_cut_effect(
     image: np.ndarray, bg_color: int, radius: int = 3, fill_color: int | None = None
 ) -> np.ndarray:
-    h, w = image.shape
     if fill_color is None:
         fill_color = bg_color
+    foreground = image != bg_color
     output = np.full_like(image, 254)
-    for i in range(h):
-        for j in range(w):
-            if image[i, j] != bg_color:
-                output[i, j] = image[i, j]
-            else:
-                # Calculate if this bg pixel is within 3 pixels distance to any non-bg pixel
-                for di in range(-3, 4):
-                    for dj in range(-3, 4):
-                        ni, nj = i + di, j + dj
-                        if (
-                            0 <= ni < h
-                            and 0 <= nj < w
-                            and np.sqrt(di**2 + dj**2) <= radius
-                        ):
-                            if image[ni, nj] != bg_color:
-                                output[i, j] = fill_color
-                                break
+    output[dilate(foreground, radius)] = fill_color
+    output[foreground] = image[foreground]
     return output
 
 
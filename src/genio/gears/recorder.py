@@ -1,8 +1,5 @@
 import json
-from collections import deque
-from collections.abc import Sequence
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Protocol
 
@@ -10,7 +7,6 @@ import cramjam
 import numpy as np
 import pyxel
 from pyxelxl.font import _image_as_ndarray
-from safetensors.numpy import save
 
 from genio.base import asset_path
 
@@ -19,42 +15,51 @@ class HasEvents(Protocol):
     events: list[int]
 
 
-@dataclass
-class FrameData:
-    buffer: deque[np.ndarray]
-    events: list[int]
+CHUNK_FRAMES = 60
+# Recordings are re-encoded on export, so favour speed on the writer thread.
+COMPRESSION_LEVEL = 1
 
 
 class FrameWriter:
-    buffer: deque[FrameData]
+    frames: np.ndarray | None
+    events: list[list[int]]
 
     def __init__(self, parent: HasEvents) -> None:
-        self.buffer = deque()
+        self.frames = None
+        self.events = []
         self.parent = parent
 
     def record_frame(self) -> None:
-        arr = _image_as_ndarray(pyxel.screen).copy()
-        self.buffer.append(FrameData(buffer=arr, events=list(set(self.parent.events))))
-
-    def flush(self, tmp_buffer: Sequence[np.ndarray], path: Path) -> None:
+        screen = _image_as_ndarray(pyxel.screen)
+        if self.frames is None:
+            self.frames = np.empty((CHUNK_FRAMES, *screen.shape), dtype=screen.dtype)
+        np.copyto(self.frames[len(self.events)], screen)
+        events = self.parent.events
+        self.events.append(list(dict.fromkeys(events)) if events else [])
+
+    def take_chunk(self) -> tuple[np.ndarray, list[list[int]]]:
+        """Hand over the recorded frames; the next frame starts a fresh chunk."""
+        frames = self.frames[: len(self.events)]
+        events = self.events
+        self.frames = None
+        self.events = []
+        return frames, events
+
+    def flush(self, frames: np.ndarray, events: list[list[int]], path: Path) -> None:
         path.mkdir(parents=True, exist_ok=True)
-        frames = np.stack([frame.buffer for frame in tmp_buffer])
-        buffer = cramjam.zstd.compress(
-            save(
-                {
-                    "frames": frames,
-                }
-            )
-        )
-        events_list = json.dumps([frame.events for frame in tmp_buffer])
-        # write two files
-        with open(path / "frames.safetensors.zstd", "wb") as f:
+        # Raw C-order pixels; frames.json records how to view them again.
+        buffer = cramjam.zstd.compress(frames, level=COMPRESSION_LEVEL)
+        header = json.dumps({"shape": frames.shape, "dtype": frames.dtype.str})
+        events_list = json.dumps(events)
+        with open(path / "frames.zstd", "wb") as f:
             f.write(buffer)
+        with open(path / "frames.json", "w") as f:
+            f.write(header)
         with open(path / "events.json", "w") as f:
             f.write(events_list)
 
     def __len__(self) -> int:
-        return len(self.buffer)
+        return len(self.events)
 
 
 class Recorder:
@@ -64,6 +69,7 @@ class Recorder:
         self.recording_name = None
         self.num_chunks = 0
         self.executor = ThreadPoolExecutor(1)
+        self.pending_flush: Future | None = None
 
     def start_recording(self) -> None:
         import datetime
@@ -79,7 +85,7 @@ class Recorder:
     def update(self) -> None:
         if self.recording_name:
             self.writer.record_frame()
-            if len(self.writer) >= 60:
+            if len(self.writer) >= CHUNK_FRAMES:
                 self.save_chunk()
 
     def draw(self) -> None:
@@ -93,9 +99,8 @@ class Recorder:
             self.start_recording()
 
     def save_chunk(self):
-        import time
-
-        t0 = time.time()
+        if not len(self.writer):
+            return
         num_chunks_leftpad = str(self.num_chunks).zfill(4)
         root = Path(asset_path(".")).parent
         # self.writer.flush()
@@ -105,11 +110,15 @@ class Recorder:
             / f"{self.recording_name}"
             / f"{self.recording_name}-{num_chunks_leftpad}"
         )
-        dumped_buffer = list(self.writer.buffer)
-        self.writer.buffer.clear()
-        self.executor.submit(self.writer.flush, dumped_buffer, fname)
+        frames, events = self.writer.take_chunk()
+        # Backpressure: if the disk falls behind, block here instead of letting
+        # chunks pile up in memory, so at most two are ever held at once.
+        if self.pending_flush is not None:
+            wait([self.pending_flush])
+        self.pending_flush = self.executor.submit(
+            self.writer.flush, frames, events, fname
+        )
         self.num_chunks += 1
-        # print(f"Saved chunk {num_chunks_leftpad} in {time.time() - t0:.2f}s")
 
     def is_recording(self) -> bool:
         return bool(self.recording_name)
@@ -1,3 +1,4 @@
+import threading
 from typing import Generic, TypeVar
 
 import hnswlib
@@ -19,7 +20,15 @@ class SentenceEmbeddingGenerator:
 
     @staticmethod
     def default():
-        return SentenceEmbeddingGenerator("wikipedia_gigaword")
+        # The model's sqlite connection only works on the thread that opened it.
+        if (gen := getattr(_thread_generators, "default", None)) is None:
+            gen = _thread_generators.default = SentenceEmbeddingGenerator(
+                "wikipedia_gigaword"
+            )
+        return gen
+
+
+_thread_generators = threading.local()
 
 
 T = TypeVar("T")
@@ -36,7 +45,11 @@ class Corpus(Generic[T]):
         p.init_index(max_elements=num_elements, ef_construction=200, M=16)
 
         gen = SentenceEmbeddingGenerator.default()
-        embeddings = np.stack([gen.sentence_embedding(s) for s in strings])
+        # The model's sqlite connection is bound to the creating thread, so
+        # fill in place serially rather than fanning out to a pool.
+        embeddings = np.empty((num_elements, dim), dtype=np.float32)
+        for i, s in enumerate(strings):
+            embeddings[i] = gen.sentence_embedding(s)
         ids = np.arange(num_elements)
         p.add_items(embeddings, ids)
         p.set_ef(10)
@@ -49,8 +62,7 @@ class Corpus(Generic[T]):
         self.search_cache = {}
 
     def _search(self, query: str) -> tuple[str, T]:
-        gen = SentenceEmbeddingGenerator.default()
-        query_embedding = gen.sentence_embedding(query)
+        query_embedding = SentenceEmbeddingGenerator.default().sentence_embedding(query)
         labels, _ = self.index.knn_query(query_embedding, k=1)
         return self.strings[labels[0][0]], self.userdata[labels[0][0]]
 
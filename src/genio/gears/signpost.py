@@ -29,6 +29,12 @@ class SignPost:
         self.timer = 0
         self.opacity = 0.0
         self.font = font
+        if font == "willow":
+            self.font_func = willow_branch
+            self.text_layout = layout(w=200, ha="center")
+        else:
+            self.font_func = capital_hill_text
+            self.text_layout = layout(w=100, ha="center")
 
         t = 20
 
@@ -101,15 +107,7 @@ class SignPost:
 
     def draw(self) -> None:
         with dithering(self.opacity):
-            font_func = willow_branch if self.font == "willow" else capital_hill_text
-            if self.font == "willow":
-                font_func(
-                    self.x - 50, self.y, self.text, 7, layout=layout(w=200, ha="center")
-                )
-            else:
-                font_func(
-                    self.x - 50, self.y, self.text, 7, layout=layout(w=100, ha="center")
-                )
+            self.font_func(self.x - 50, self.y, self.text, 7, layout=self.text_layout)
 
     def update(self) -> None:
         self.tweener.update()
@@ -7,60 +7,21 @@ import PIL.Image as Image
 import pyxel
 from pyxelxl.font import _image_as_ndarray
 
+from genio.base import apply_palette_conversion
 from genio.gears.sentence_embed import Corpus
 
 
-@cache
-def calculate_rgb2paletteix() -> dict:
-    palette = pyxel.colors.to_list()
-    rgb2paletteix = {}
-    for i, rgb in enumerate(palette):
-        r = rgb >> 16 & 0xFF
-        g = rgb >> 8 & 0xFF
-        b = rgb & 0xFF
-        rgb2paletteix[(r, g, b)] = i
-    return rgb2paletteix
-
-
-def apply_palette_conversion(image: Image.Image) -> np.ndarray:
-    rgb2paletteix = calculate_rgb2paletteix()
-    buffer = np.full((image.height, image.width), 254, dtype=np.uint8)
-
-    for y in range(image.height):
-        for x in range(image.width):
-            r, g, b, a = image.getpixel((x, y))
-            if a != 0:
-                if a != 255:
-                    ...
-                try:
-                    buffer[y, x] = rgb2paletteix[(r, g, b)]
-                except KeyError:
-                    rgb = (r, g, b)
-                    closest_color = min(
-                        rgb2paletteix.keys(),
-                        key=lambda c: sum((c[i] - rgb[i]) ** 2 for i in range(3)),
-                    )
-                    raise ValueError(
-                        f"Unexpected color: {r}, {g}, {b}; closest: {closest_color} at {rgb2paletteix[closest_color]}"
-                    )
-    return buffer
-
-
 def buffer_to_image(buffer: np.ndarray) -> pyxel.Image:
     pimage = pyxel.Image(buffer.shape[1], buffer.shape[0])
     _image_as_ndarray(pimage)[:] = buffer
     return pimage
 
 
-def pil_image_to_pyxel_image(image: Image.Image) -> pyxel.Image:
-    buffer = apply_palette_conversion(image)
-    return buffer_to_image(buffer)
-
-
-def iterate_cells_of_spritesheet(path: str) -> Iterator[tuple[str, Image.Image]]:
+def iterate_cells_of_spritesheet(path: str) -> Iterator[tuple[str, pyxel.Image]]:
     with open(path) as f:
         data = json.load(f)
     parent_image = Image.open(path.replace(".json", ".png")).convert("RGBA")
+    parent_pixels = np.asarray(parent_image)
     for frame_name, frame_metadata in data["frames"].items():
         frame_name = frame_name.split(".")[0]
         frame_name = frame_name.replace("(", "").replace(")", "")
@@ -73,10 +34,18 @@ def iterate_cells_of_spritesheet(path: str) -> Iterator[tuple[str, Image.Image]]
         )
         yield (
             frame_name,
-            pil_image_to_pyxel_image(parent_image.crop((x, y, x + w, y + h))),
+            buffer_to_image(
+                apply_palette_conversion(parent_pixels[y : y + h, x : x + w])
+            ),
         )
 
 
+@cache
+def spritesheet_frames(path: str) -> tuple[tuple[str, pyxel.Image], ...]:
+    """Decoded frames of a spritesheet, shared by every `Spritesheet` on it."""
+    return tuple(iterate_cells_of_spritesheet(path))
+
+
 class Spritesheet(Mapping[str, pyxel.Image]):
     embeddings: np.ndarray
 
@@ -85,7 +54,7 @@ class Spritesheet(Mapping[str, pyxel.Image]):
         paths = path if isinstance(path, list) else [path]
         self.images = {}
         for path in paths:
-            for frame_name, frame_image in iterate_cells_of_spritesheet(path):
+            for frame_name, frame_image in spritesheet_frames(path):
                 self.images[frame_name] = frame_image
         self._keys = []
         if build_search_index:
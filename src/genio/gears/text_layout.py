@@ -1,4 +1,5 @@
 import textwrap
+from functools import cache, lru_cache
 
 import pyxel
 from pyxel import Image
@@ -10,6 +11,27 @@ def text_width(s: str) -> int:
     return len(s) * 4
 
 
+@cache
+def text_wrapper(width: int) -> textwrap.TextWrapper:
+    return textwrap.TextWrapper(width=width)
+
+
+@lru_cache(512)
+def aligned_lines(
+    s: str, max_width: int, horizontal_align: str
+) -> tuple[tuple[int, str], ...]:
+    """Wrapped lines of `s`, each with its x offset inside `max_width`."""
+    lines = []
+    for line in text_wrapper(max_width // 4).wrap(s):
+        x_pad = 0
+        if horizontal_align == "center":
+            x_pad = (max_width - text_width(line)) // 2
+        elif horizontal_align == "right":
+            x_pad = max_width - text_width(line)
+        lines.append((x_pad, line))
+    return tuple(lines)
+
+
 class PyxelDefaultFont(DrawTextLike):
     def __call__(
         self,
@@ -25,13 +47,8 @@ class PyxelDefaultFont(DrawTextLike):
         if not layout:
             pyxel.text(x, y, s, col)
             return
-        wrapped = textwrap.wrap(s, width=layout.max_width // 4)
-        for i, line in enumerate(wrapped):
-            x_pad = 0
-            if layout.horizontal_align == "center":
-                x_pad = (layout.max_width - text_width(line)) // 2
-            elif layout.horizontal_align == "right":
-                x_pad = layout.max_width - text_width(line)
+        lines = aligned_lines(s, layout.max_width, layout.horizontal_align)
+        for i, (x_pad, line) in enumerate(lines):
             pyxel.text(x + x_pad, y + i * 6, line, col)
 
 
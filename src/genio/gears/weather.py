@@ -1,3 +1,4 @@
+import math
 from enum import Enum
 
 import numpy as np
@@ -33,30 +34,31 @@ class WeatherEffect:
         self.anim_pool = anim_pool
 
     def update(self, dt: float = 1 / 30) -> None:
-        self.energy += np.random.poisson(self.frequency * dt)
-        while self.energy > 1 / self.frequency:
-            self.energy -= 1 / self.frequency
-            self.fire()
-
-    def fire(self) -> None:
+        self.energy += rng.poisson(self.frequency * dt)
+        # Number of times `energy > 1 / frequency` would hold if spent one by one.
+        num_events = max(math.ceil(self.energy * self.frequency) - 1, 0)
+        if num_events:
+            self.energy -= num_events / self.frequency
+            self.fire(num_events)
+
+    def fire(self, num_events: int = 1) -> None:
         match self.weather_type:
             case WeatherType.RAINY:
-                position_xy = rng.standard_normal(2)
-                position_xy *= 0.5
-                position_xy += np.array([0.5, 0.5])
-                position_xy[0] *= WINDOW_WIDTH
-                position_xy[1] *= WINDOW_HEIGHT
-                position_xy[0] = position_xy[0] % WINDOW_WIDTH
-                position_xy[1] = position_xy[1] % WINDOW_HEIGHT
+                positions = rng.standard_normal((num_events, 2))
+                positions *= 0.5
+                positions += 0.5
+                positions *= (WINDOW_WIDTH, WINDOW_HEIGHT)
+                positions %= (WINDOW_WIDTH, WINDOW_HEIGHT)
             case WeatherType.BORDER_RIGHT_WIND:
-                position_xy = np.array(
+                positions = np.column_stack(
                     [
-                        rng.uniform(WINDOW_WIDTH * 0.98, WINDOW_WIDTH),
-                        rng.uniform(-20, WINDOW_HEIGHT * 0.7),
+                        rng.uniform(WINDOW_WIDTH * 0.98, WINDOW_WIDTH, num_events),
+                        rng.uniform(-20, WINDOW_HEIGHT * 0.7, num_events),
                     ]
                 )
-        chosen_anim = rng.choice(self.anim_pool)
-        self.parent.add_anim(chosen_anim, *position_xy)
+        chosen_anims = rng.choice(self.anim_pool, num_events)
+        for chosen_anim, (x, y) in zip(chosen_anims, positions.tolist()):
+            self.parent.add_anim(chosen_anim, x, y)
 
 
 class WeatherTestScene:
@@ -156,8 +156,11 @@ class CardSprite:
         else:
             raise ValueError("Cannot transition to resolving")
 
-        num_total_cards = len(self.app.bundle.card_bundle.resolving)
-        my_index = self.app.bundle.card_bundle.resolving.index(self.card)
+        resolving = self.app.bundle.card_bundle.resolving
+        num_total_cards = len(resolving)
+        my_index = next(
+            i for i, card in enumerate(resolving) if card.id == self.card.id
+        )
 
         self.update_delay += my_index * 6
         self.index = 0
@@ -275,10 +278,7 @@ class CardSprite:
                 rot=self.rotation,
             )
             pyxel.pal()
-            if (
-                not self.selected
-                and any(card for card in self.app.card_sprites if card.selected)
-            ) or (
+            if (not self.selected and self.app.bundle.proposed_cards) or (
                 self.app.should_all_cards_disabled()
                 and not self.selected
                 and self.state != CardState.RESOLVING
@@ -344,8 +344,9 @@ class CardSprite:
             self.dragging_time += 1
         else:
             self.dragging_time = 0
+        mouse_over = self.is_mouse_over()
         if pyxel.btnp(pyxel.MOUSE_BUTTON_LEFT):
-            if self.is_mouse_over():
+            if mouse_over:
                 self.dragging = True
                 self.drag_offset_x = pyxel.mouse_x - self.x
                 self.drag_offset_y = pyxel.mouse_y - self.y
@@ -364,6 +365,8 @@ class CardSprite:
         if self.dragging:
             self.x = pyxel.mouse_x - self.drag_offset_x
             self.y = pyxel.mouse_y - self.drag_offset_y
+            # The drag offset was taken inside the card, so it stays under the mouse.
+            mouse_over = True
 
         inverse_index = self.deck_length - self.index - 1
         # Tweening for smooth transition
@@ -388,7 +391,7 @@ class CardSprite:
                     )
                 )
 
-        if self.is_mouse_over():
+        if mouse_over:
             if self.hovered:
                 self.highlight_timer += 1
             else:
@@ -1,10 +1,9 @@
 from functools import partial
 from typing import Any
 
-from genio.base import asset_path
-from genio.core.base import fmap_leaves, render_jinjaish_string, slurp_toml
+from genio.core.base import fmap_leaves, render_jinjaish_string, slurp_strings
 
-predef = fmap_leaves(render_jinjaish_string, slurp_toml(asset_path("strings.toml")))
+predef = fmap_leaves(render_jinjaish_string, slurp_strings())
 
 
 def access(structure, lens: str, default: Any = ...) -> Any:
@@ -24,8 +23,7 @@ access_predef = partial(access, predef)
 
 
 def refresh_predef():
-    reloaded = fmap_leaves(
-        render_jinjaish_string, slurp_toml(asset_path("strings.toml"))
-    )
+    slurp_strings.cache_clear()
+    reloaded = fmap_leaves(render_jinjaish_string, slurp_strings())
     for k, v in reloaded.items():
         predef[k] = v
@@ -0,0 +1,49 @@
+import json
+
+import cramjam
+import numpy as np
+from safetensors.numpy import save
+
+from genio.gears.h264_encoder import iterator_of_raw_frames
+from genio.gears.recorder import FrameWriter
+
+
+def random_frames(seed: int, num_frames: int = 5) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 16, (num_frames, 24, 32), dtype=np.uint8)
+
+
+def test_flushed_chunks_round_trip(tmp_path):
+    writer = FrameWriter(parent=None)
+    chunks = [
+        (random_frames(0), [[1], [], [2, 3], [], []]),
+        (random_frames(1, num_frames=3), [[], [4], []]),
+    ]
+    for i, (frames, events) in enumerate(chunks):
+        writer.flush(frames, events, tmp_path / f"rec-{i:04d}")
+
+    loaded = list(iterator_of_raw_frames(str(tmp_path)))
+
+    assert len(loaded) == len(chunks)
+    for (frames, events), (loaded_frames, loaded_events) in zip(chunks, loaded):
+        assert loaded_frames.dtype == frames.dtype
+        assert loaded_frames.shape == frames.shape
+        assert loaded_frames.tobytes() == frames.tobytes()
+        assert loaded_events == events
+
+
+def test_reads_legacy_safetensors_chunk(tmp_path):
+    frames = random_frames(2)
+    events = [[0], [], [], [1], []]
+    chunk = tmp_path / "rec-0000"
+    chunk.mkdir()
+    (chunk / "frames.safetensors.zstd").write_bytes(
+        bytes(cramjam.zstd.compress(save({"frames": frames})))
+    )
+    (chunk / "events.json").write_text(json.dumps(events))
+
+    [(loaded_frames, loaded_events)] = iterator_of_raw_frames(str(tmp_path))
+
+    assert loaded_frames.tobytes() == frames.tobytes()
+    assert loaded_frames.shape == frames.shape
+    assert loaded_events == events